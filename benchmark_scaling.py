@@ -0,0 +1,266 @@
+"""
+Scaling benchmark for the Canadian Workforce Analytics Dashboard.
+
+For each dataset size this generates a synthetic CSV (see ``synthetic_data.py``),
+then, in a fresh Python process so peak memory is measured per size:
+
+* times ``pd.read_csv`` and the dashboard's ``preprocess`` step,
+* records peak resident memory after loading,
+* times every dashboard callback with its default input on the loaded data.
+
+The results are written as a CSV and as an HTML log-log scaling curve. For
+each metric the local scaling exponent between consecutive sizes is printed;
+an exponent above ``--threshold`` (default 1.15) marks where the code has
+become super-linear in the row count.
+
+Memory is measured above a baseline taken after the dashboard module (dash,
+plotly and the real ``dataset.csv``) has been imported. Below about
+``MIN_MEMORY_ROWS`` rows the difference is mostly allocator noise, so memory
+exponents are only computed between sizes at or above it.
+
+Usage:
+    python benchmark_scaling.py
+    python benchmark_scaling.py --sizes 1e3,1e4,1e5,1e6,1e7,1e8 --extra-dimensions
+"""
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import math
+import statistics
+import subprocess
+import sys
+import time
+import warnings
+from pathlib import Path
+
+import pandas as pd
+
+import synthetic_data
+
+HERE = Path(__file__).resolve().parent
+
+# Dashboard callbacks and the default inputs they receive on page load
+CALLBACKS = [
+    ('update_essential_services', ('nurse',)),
+    ('update_gender_noc', ('Ontario',)),
+    ('update_engineer_graph', (['21311', '21310', '21301', 'total'],)),
+    ('update_occupations', ('Ontario',)),
+]
+METRICS = (['read_csv_s', 'preprocess_s', 'load_mem_mb']
+           + [f"{name}_s" for name, _ in CALLBACKS])
+# Smallest size whose memory delta is large enough to be worth a scaling exponent
+MIN_MEMORY_ROWS = 100_000
+
+
+def _peak_rss_mb():
+    """Peak resident set size of this process in MB, or None where unsupported."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak / 1024 ** 2 if sys.platform == 'darwin' else peak / 1024
+
+
+def _cached_rows(path):
+    """Number of data rows in a cached CSV, counted without parsing it."""
+    lines = 0
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 24), b''):
+            lines += chunk.count(b'\n')
+    return lines - 1
+
+
+def run_worker(path, repeat):
+    """Load ``path`` into the dashboard and time its callbacks; return a dict of results."""
+    warnings.simplefilter('ignore')
+    import canada_workforce_dashboard as dashboard
+
+    baseline_mb = _peak_rss_mb()
+    start = time.perf_counter()
+    raw = pd.read_csv(path)
+    read_csv_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    dashboard.df = dashboard.preprocess(raw)
+    preprocess_s = time.perf_counter() - start
+    rows = len(raw)
+    del raw
+    load_peak_mb = _peak_rss_mb()
+
+    result = {
+        'rows': rows,
+        'read_csv_s': read_csv_s,
+        'preprocess_s': preprocess_s,
+        'baseline_mb': baseline_mb,
+        'load_peak_mb': load_peak_mb,
+        'load_mem_mb': None if baseline_mb is None else load_peak_mb - baseline_mb,
+    }
+    for name, args in CALLBACKS:
+        callback = getattr(dashboard, name)
+        timings = []
+        for _ in range(repeat):
+            # update_occupations logs progress with print(); keep it out of the results
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                callback(*args)
+                timings.append(time.perf_counter() - start)
+        result[f"{name}_s"] = statistics.median(timings)
+    result['peak_mb'] = _peak_rss_mb()
+    return result
+
+
+def local_exponents(results, metric, min_rows=0):
+    """Slope of log(metric) against log(rows) between consecutive sizes of at least ``min_rows``."""
+    # Compare against the row count the generator actually produces for ``min_rows``
+    min_rows = synthetic_data.row_count(min_rows)
+    exponents = [None]
+    for prev, curr in zip(results, results[1:]):
+        a, b = prev[metric], curr[metric]
+        if (prev['rows'] < min_rows or not a or not b or a <= 0 or b <= 0
+                or curr['rows'] == prev['rows']):
+            exponents.append(None)
+        else:
+            exponents.append(math.log(b / a) / math.log(curr['rows'] / prev['rows']))
+    return exponents
+
+
+def write_plot(results, path):
+    """Write a log-log scaling curve of every metric, with a linear reference line."""
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    rows = [r['rows'] for r in results]
+    fig = make_subplots(rows=1, cols=2, subplot_titles=(
+        "Time (s)", f"Memory above baseline (MB, noisy below {MIN_MEMORY_ROWS:,} rows)"))
+    for metric in METRICS:
+        values = [r[metric] for r in results]
+        col = 2 if metric.endswith('_mb') else 1
+        fig.add_trace(go.Scatter(x=rows, y=values, mode='lines+markers', name=metric),
+                      row=1, col=col)
+        # Linear reference anchored at the largest size, to make super-linear growth visible
+        if values[-1]:
+            fig.add_trace(go.Scatter(
+                x=rows, y=[values[-1] * n / rows[-1] for n in rows],
+                mode='lines', line=dict(dash='dot', width=1), opacity=0.4,
+                name=f"{metric} (linear)", showlegend=False
+            ), row=1, col=col)
+    fig.update_xaxes(type='log', title='Rows')
+    fig.update_yaxes(type='log')
+    fig.update_layout(title="Dashboard scaling with dataset size", title_x=0.5, height=600)
+    fig.write_html(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dashboard scaling with row count.")
+    parser.add_argument('--sizes', default='1e3,1e4,1e5,1e6',
+                        help="comma-separated row counts, e.g. 1e3,1e4,1e5,1e6,1e7,1e8")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per callback (median is kept)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--occupations', type=int, default=500,
+                        help="synthetic NOC unit groups added to the seed occupations")
+    parser.add_argument('--extra-dimensions', action='store_true')
+    parser.add_argument('--data-dir', default=str(HERE / 'bench_data'),
+                        help="where generated datasets are cached")
+    parser.add_argument('--output', default='scaling_results.csv')
+    parser.add_argument('--plot', default='scaling_curve.html')
+    parser.add_argument('--threshold', type=float, default=1.15,
+                        help="local exponent above which growth is reported as super-linear")
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_worker(args.worker, args.repeat)))
+        return
+
+    sizes = sorted(int(float(size)) for size in args.sizes.split(','))
+    data_dir = Path(args.data_dir)
+    data_dir.mkdir(parents=True, exist_ok=True)
+
+    # Key cached datasets on the generator version and the seed data they were built from
+    seed_hash = hashlib.sha1(synthetic_data.SEED_PATH.read_bytes()).hexdigest()[:8]
+    suffix = '_extra' if args.extra_dimensions else ''
+
+    results = []
+    failed = None
+    for size in sizes:
+        path = data_dir / (f"synthetic_{size}_s{args.seed}_o{args.occupations}{suffix}"
+                           f"_v{synthetic_data.GENERATOR_VERSION}_{seed_hash}.csv")
+        expected_rows = synthetic_data.row_count(size)
+        if path.exists() and _cached_rows(path) != expected_rows:
+            print(f"Cached {path} does not hold {expected_rows:,} rows; regenerating")
+            path.unlink()
+        if not path.exists():
+            print(f"Generating {size:,} rows -> {path}")
+            # Write to a temporary name first so an interrupted run never leaves a partial cache
+            partial = path.with_suffix('.partial')
+            synthetic_data.write_csv(
+                partial,
+                size,
+                seed=args.seed,
+                n_occupations=args.occupations,
+                extra_dimensions=synthetic_data.EXTRA_DIMENSIONS if args.extra_dimensions else None,
+            )
+            partial.replace(path)
+        print(f"Benchmarking {size:,} rows...")
+        worker = subprocess.run(
+            [sys.executable, __file__, '--worker', str(path), '--repeat', str(args.repeat)],
+            cwd=HERE, capture_output=True, text=True
+        )
+        if worker.returncode != 0:
+            # Typically the worker ran out of memory; larger sizes would fail too
+            print(f"Worker failed at {size:,} rows (exit code {worker.returncode}):")
+            print(worker.stderr.strip() or "(no output on stderr)")
+            failed = size
+            break
+        results.append(json.loads(worker.stdout.strip().splitlines()[-1]))
+
+    if not results:
+        print("No size completed; nothing to report.")
+        sys.exit(1)
+
+    table = pd.DataFrame(results)
+    for metric in METRICS:
+        min_rows = MIN_MEMORY_ROWS if metric.endswith('_mb') else 0
+        table[f"{metric}_exponent"] = local_exponents(results, metric, min_rows)
+    table.to_csv(args.output, index=False)
+
+    print()
+    print(table[['rows'] + METRICS].to_string(index=False, float_format=lambda v: f"{v:.4g}"))
+    print("\nLocal scaling exponents (1.0 = linear):")
+    print(table[['rows'] + [f"{m}_exponent" for m in METRICS]]
+          .rename(columns=lambda c: c.replace('_exponent', ''))
+          .to_string(index=False, float_format=lambda v: f"{v:.2f}"))
+
+    print()
+    for metric in METRICS:
+        exponents = table[f"{metric}_exponent"]
+        flagged = table.loc[exponents > args.threshold, 'rows']
+        if exponents.isna().all():
+            if metric.endswith('_mb'):
+                print(f"{metric}: needs two sizes of at least {MIN_MEMORY_ROWS:,} rows "
+                      f"(smaller deltas are allocator noise)")
+            else:
+                print(f"{metric}: needs at least two sizes")
+        elif flagged.empty:
+            print(f"{metric}: no super-linear growth up to {results[-1]['rows']:,} rows")
+        else:
+            print(f"{metric}: super-linear from {flagged.iloc[0]:,} rows "
+                  f"(exponent {exponents[flagged.index[0]]:.2f})")
+
+    if len(results) > 1:
+        write_plot(results, args.plot)
+        print(f"\nWrote {args.output} and {args.plot}")
+    else:
+        print(f"\nWrote {args.output}")
+
+    if failed is not None:
+        print(f"Stopped early: the benchmark failed at {failed:,} rows.")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -6,10 +6,15 @@ import dash_bootstrap_components as dbc
 from dash_bootstrap_templates import load_figure_template
 
 # Data loading and preprocessing
-df = pd.read_csv("dataset.csv")
-df = df[df['Province'] != 'Canada'].copy()
-df['NOC'] = df['Occupation'].str.extract(r'^(\d)')
-df['NOC Label'] = df['Occupation'].where(df['NOC'].notna(), None)
+def preprocess(raw):
+    """Drop the national rows and derive the NOC columns used by the callbacks."""
+    df = raw[raw['Province'] != 'Canada'].copy()
+    df['NOC'] = df['Occupation'].str.extract(r'^(\d)')
+    df['NOC Label'] = df['Occupation'].where(df['NOC'].notna(), None)
+    return df
+
+
+df = preprocess(pd.read_csv("dataset.csv"))
 provinces = sorted(df['Province'].unique())
 
 # Initialize the app
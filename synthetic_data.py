@@ -0,0 +1,222 @@
+"""
+Synthetic scale-up data for the Canadian Workforce Analytics Dashboard.
+
+Generates datasets with the same schema as ``dataset.csv``
+(``Province``, ``Occupation``, ``Gender``, ``Employment``) at any size from a
+thousand rows up to hundreds of millions, so the loading code and the
+dashboard callbacks can be exercised at the scale of the full StatCan table.
+
+The statistics are taken from ``dataset.csv`` itself:
+
+* every row belongs to a (Total, Men, Women) triple for one cell, as in the
+  real table, and ``Men + Women == Total`` for every triple (the row count is
+  rounded down to a multiple of 3 so no triple is ever cut short);
+* the seed occupations keep their real per-province employment and gender
+  split, so the essential services and engineering charts stay meaningful;
+* extra NOC unit groups can be added on top of the seed occupations; they take
+  ``UNIT_GROUP_SHARE`` of the matching NOC major group of each province, and
+  the major-group row keeps the rest, so major group plus synthetic unit
+  groups add up to the real major-group figure;
+* when there are more rows than cells, each row stands for a finer breakdown
+  of its cell and employment is divided accordingly, so aggregates stay close
+  to the real figures at every size.
+
+Output is deterministic for a given set of arguments. Rows are produced in
+fixed-size blocks so arbitrarily large files can be streamed to disk.
+
+Usage:
+    python synthetic_data.py 1000000 -o synthetic_1e6.csv
+    python synthetic_data.py 1e8 -o synthetic_1e8.csv --extra-dimensions
+"""
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+SEED_PATH = Path(__file__).with_name("dataset.csv")
+# Bump whenever the output for a given set of arguments changes, so cached datasets are rebuilt
+GENERATOR_VERSION = 3
+GENDERS = ['Total', 'Men', 'Women']
+BLOCK_ROWS = 300_000  # multiple of 3 so gender triples never straddle blocks
+NOISE_SIGMA = 0.25
+# Fraction of each NOC major group moved into the synthetic unit groups
+UNIT_GROUP_SHARE = 0.5
+
+# Optional extra breakdowns, modelled on the other dimensions of the StatCan table
+EXTRA_DIMENSIONS = {
+    'Age group': ['15 to 24 years', '25 to 34 years', '35 to 44 years',
+                  '45 to 54 years', '55 to 64 years', '65 years and over'],
+    'Class of worker': ['Employee', 'Self-employed'],
+    'Highest certificate': ['No certificate', 'High school diploma',
+                            'Apprenticeship or trades certificate',
+                            'College diploma', "Bachelor's degree or higher"],
+}
+
+
+class _Model:
+    """Per-province, per-occupation employment and gender split used for sampling."""
+
+    def __init__(self, seed_path, n_occupations, seed):
+        rng = np.random.default_rng([seed, 0])
+        seed_df = pd.read_csv(seed_path)
+        provinces = list(seed_df['Province'].unique())
+        occupations = list(seed_df['Occupation'].unique())
+
+        def pivot(gender):
+            return (seed_df[seed_df['Gender'] == gender]
+                    .pivot(index='Province', columns='Occupation', values='Employment')
+                    .reindex(index=provinces, columns=occupations)
+                    .fillna(0)
+                    .to_numpy(dtype=float, copy=True))
+
+        totals = pivot('Total')
+        men = pivot('Men')
+        with np.errstate(divide='ignore', invalid='ignore'):
+            men_share = np.where(totals > 0, men / totals, 0.5)
+
+        codes = [occupation.split(' ', 1)[0] for occupation in occupations]
+        if n_occupations:
+            # NOC major groups are the single-digit rows of the seed table
+            major = {code: i for i, code in enumerate(codes) if len(code) == 1}
+            group_codes = sorted(major)
+            group_cols = [major[code] for code in group_codes]
+            group_totals = totals[:, group_cols]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                group_men = np.where(group_totals > 0, men[:, group_cols] / group_totals, 0.5)
+
+            # Spread the new unit groups over major groups in proportion to national employment
+            weights = group_totals.sum(axis=0)
+            group_idx = rng.choice(len(group_codes), size=n_occupations, p=weights / weights.sum())
+
+            new_codes = np.empty(n_occupations, dtype=object)
+            for g, group_code in enumerate(group_codes):
+                members = np.flatnonzero(group_idx == g)
+                taken = {int(code[1:]) for code in codes
+                         if len(code) == 5 and code[0] == group_code}
+                available = np.setdiff1d(np.arange(10_000), list(taken))
+                if len(members) > len(available):
+                    raise ValueError(f"Too many synthetic occupations for NOC group {group_code}")
+                suffixes = rng.choice(available, size=len(members), replace=False)
+                new_codes[members] = [f"{group_code}{suffix:04d}" for suffix in suffixes]
+
+            # Heavy-tailed unit group sizes, normalised within each major group and
+            # taken out of the major-group cells so employment is not counted twice
+            sizes = rng.lognormal(0.0, 1.0, n_occupations)
+            group_sums = np.bincount(group_idx, weights=sizes, minlength=len(group_codes))
+            new_totals = (group_totals[:, group_idx] * UNIT_GROUP_SHARE
+                          * (sizes / group_sums[group_idx]))
+            totals[:, group_cols] = group_totals * (1 - UNIT_GROUP_SHARE)
+            new_men = np.clip(group_men[:, group_idx] + rng.normal(0.0, 0.1, n_occupations),
+                              0.02, 0.98)
+
+            occupations += [f"{code} Synthetic unit group" for code in new_codes]
+            totals = np.hstack([totals, new_totals])
+            men_share = np.hstack([men_share, new_men])
+
+        self.provinces = provinces
+        self.occupations = occupations
+        self.totals = totals
+        self.men_share = men_share
+
+
+def row_count(rows):
+    """Number of rows actually generated for a request of ``rows``: whole gender triples only."""
+    rows = int(rows)
+    return rows - rows % 3
+
+
+def generate(rows, seed=0, n_occupations=500, extra_dimensions=None, seed_path=SEED_PATH):
+    """
+    Yield DataFrame blocks that together hold ``rows`` synthetic rows.
+
+    ``rows`` is rounded down to a multiple of 3 so every (Total, Men, Women)
+    triple is complete.
+
+    Args:
+        rows: Total number of rows to generate.
+        seed: Random seed; the same arguments always give the same data.
+        n_occupations: Number of synthetic NOC unit groups added to the seed occupations.
+        extra_dimensions: Optional mapping of column name to categories, e.g. EXTRA_DIMENSIONS.
+        seed_path: CSV the statistics are taken from.
+    """
+    if int(rows) < 0:
+        raise ValueError("rows must be non-negative")
+    rows = row_count(rows)
+    extra_dimensions = extra_dimensions or {}
+    model = _Model(seed_path, n_occupations, seed)
+    n_provinces = len(model.provinces)
+    n_occupations_total = len(model.occupations)
+
+    n_triples = rows // 3
+    # Each cell is split across this many triples on average, so divide its employment too
+    fanout = max(1.0, n_triples / (n_provinces * n_occupations_total))
+    genders = pd.Categorical.from_codes(np.tile([0, 1, 2], BLOCK_ROWS // 3), GENDERS)
+
+    for block, start in enumerate(range(0, rows, BLOCK_ROWS)):
+        rng = np.random.default_rng([seed, block + 1])
+        block_rows = min(BLOCK_ROWS, rows - start)
+        triples = block_rows // 3
+
+        province_idx = rng.integers(n_provinces, size=triples)
+        occupation_idx = rng.integers(n_occupations_total, size=triples)
+        noise = rng.lognormal(-NOISE_SIGMA ** 2 / 2, NOISE_SIGMA, triples)
+        total = np.rint(model.totals[province_idx, occupation_idx] / fanout * noise).astype(np.int64)
+        men = rng.binomial(total, model.men_share[province_idx, occupation_idx])
+        employment = np.column_stack([total, men, total - men]).ravel()
+
+        columns = {
+            'Province': pd.Categorical.from_codes(np.repeat(province_idx, 3), model.provinces),
+            'Occupation': pd.Categorical.from_codes(np.repeat(occupation_idx, 3), model.occupations),
+            'Gender': genders[:triples * 3],
+            'Employment': employment,
+        }
+        for name, categories in extra_dimensions.items():
+            codes = rng.integers(len(categories), size=triples)
+            columns[name] = pd.Categorical.from_codes(np.repeat(codes, 3), categories)
+
+        yield pd.DataFrame(columns)
+
+
+def generate_frame(rows, **kwargs):
+    """Return ``rows`` synthetic rows as a single DataFrame (see ``generate``)."""
+    blocks = list(generate(rows, **kwargs))
+    if not blocks:
+        return pd.DataFrame(columns=['Province', 'Occupation', 'Gender', 'Employment'])
+    return pd.concat(blocks, ignore_index=True)
+
+
+def write_csv(path, rows, **kwargs):
+    """Stream ``rows`` synthetic rows to ``path`` without holding them all in memory."""
+    with open(path, 'w', newline='') as f:
+        header = True
+        for block in generate(rows, **kwargs):
+            block.to_csv(f, index=False, header=header)
+            header = False
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic workforce dataset.")
+    parser.add_argument('rows', type=lambda s: int(float(s)), help="number of rows, e.g. 1e6")
+    parser.add_argument('-o', '--output', default=None, help="output CSV path")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--occupations', type=int, default=500,
+                        help="synthetic NOC unit groups added to the seed occupations")
+    parser.add_argument('--extra-dimensions', action='store_true',
+                        help="add " + ", ".join(EXTRA_DIMENSIONS) + " columns")
+    args = parser.parse_args()
+
+    output = args.output or f"synthetic_{args.rows}.csv"
+    write_csv(
+        output,
+        args.rows,
+        seed=args.seed,
+        n_occupations=args.occupations,
+        extra_dimensions=EXTRA_DIMENSIONS if args.extra_dimensions else None,
+    )
+    print(f"Wrote {row_count(args.rows):,} rows to {output}")
+
+
+if __name__ == '__main__':
+    main()